@@ -8,7 +8,7 @@ They handle user input, call services, handle exceptions, and display results.
 import typer
 from pathlib import Path
 from dependency_injector.wiring import inject, Provide
-from rich.console import Console
+from src.utils.console import console
 from src.container import Container
 from src.services.contact_service import ContactService
 from src.utils.validators import validate_birthday
@@ -16,7 +16,6 @@ from src.utils.command_decorators import handle_service_errors, auto_save
 from src.utils.paths import get_storage_path
 
 app = typer.Typer()
-console = Console()
 
 
 @inject
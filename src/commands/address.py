@@ -10,7 +10,7 @@ import typer
 from typing import Optional
 from functools import partial
 from dependency_injector.wiring import Provide, inject
-from rich.console import Console
+from src.utils.console import console
 
 from src.container import Container
 from src.services.contact_service import ContactService
@@ -23,7 +23,6 @@ app = typer.Typer(
     help="Manage addresses for contacts",
     invoke_without_command=True
 )
-console = Console()
 
 
 # ============================================================================
@@ -9,7 +9,7 @@ from typing import Optional
 
 import typer
 from dependency_injector.wiring import inject, Provide
-from rich.console import Console
+from src.utils.console import console
 from rich.panel import Panel
 from src.container import Container
 from src.services.contact_service import ContactService, ContactSortBy
@@ -17,7 +17,6 @@ from src.utils.command_decorators import handle_service_errors
 from rich.tree import Tree
 
 app = typer.Typer()
-console = Console()
 
 def show_address_book(book: dict) -> Tree:
     tree = Tree("[bold cyan]Address Book[/]")
@@ -7,13 +7,12 @@ They handle user input, call services, handle exceptions, and display results.
 
 import typer
 from dependency_injector.wiring import inject, Provide
-from rich.console import Console
+from src.utils.console import console
 from src.container import Container
 from src.services.contact_service import ContactService
 from src.utils.command_decorators import handle_service_errors, auto_save
 
 app = typer.Typer()
-console = Console()
 
 
 @inject
@@ -5,10 +5,9 @@ This command provides a user-friendly way to exit the CLI application.
 """
 
 import typer
-from rich.console import Console
+from src.utils.console import console
 
 app = typer.Typer(help="Exit the application")
-console = Console()
 
 
 @app.command(name="exit")
@@ -4,15 +4,13 @@ from typing import Optional
 
 import typer
 from dependency_injector.wiring import inject, Provide
-from rich.console import Console
-from rich.table import Table
+from src.utils.console import console
 
 from src.container import Container
 from src.services.contact_service import ContactService
 from src.utils.command_decorators import handle_service_errors, auto_save
 
 app = typer.Typer()
-console = Console()
 
 
 # --- list groups ---
@@ -29,14 +27,19 @@ def _group_list_impl(
         console.print("[yellow]No groups defined.[/yellow]")
         return
 
+    # imported lazily: only this command needs rich's table machinery
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Groups")
     table.add_column("Group ID", style="cyan", no_wrap=True)
     table.add_column("Contacts", style="magenta")
     table.add_column("Current", style="green")
 
+    # Text cells are rendered as-is, Rich doesn't parse them for markup
     for group_id, count in groups:
         marker = "●" if group_id == current else ""
-        table.add_row(group_id, str(count), marker)
+        table.add_row(Text(group_id), Text(str(count)), Text(marker))
 
     console.print(table)
 
@@ -5,10 +5,9 @@ Simple command that doesn't require any services.
 """
 
 import typer
-from rich.console import Console
+from src.utils.console import console
 
 app = typer.Typer()
-console = Console()
 
 
 @app.command(name="hello")
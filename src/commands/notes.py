@@ -17,7 +17,7 @@ import typer
 from typing import List, Optional
 from functools import partial
 from dependency_injector.wiring import Provide, inject
-from rich.console import Console
+from src.utils.console import console
 from rich.tree import Tree
 
 from src.container import Container
@@ -34,7 +34,6 @@ app = typer.Typer(
     help="Manage notes for contacts",
     invoke_without_command=True
 )
-console = Console()
 
 
 # ============================================================================
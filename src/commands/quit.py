@@ -6,10 +6,9 @@ way for users to exit the CLI application.
 """
 
 import typer
-from rich.console import Console
+from src.utils.console import console
 
 app = typer.Typer(help="Quit the application")
-console = Console()
 
 
 @app.command(name="quit")
@@ -11,7 +11,9 @@ import typer
 from typing import Optional
 from functools import partial
 from dependency_injector.wiring import Provide, inject
-from rich.console import Console
+from src.utils.console import console
+from rich.panel import Panel
+from rich.text import Text
 from rich.tree import Tree
 
 from src.container import Container
@@ -21,6 +23,7 @@ from src.services.search_service import (
     NoteSearchType
 )
 from src.utils.command_decorators import handle_service_errors
+from src.utils.validators import split_tags_string
 from src.utils.progressive_params import progressive_params
 from src.utils.interactive_menu import auto_menu, menu_command_map
 
@@ -28,18 +31,41 @@ app = typer.Typer(
     help="Search contacts and notes",
     invoke_without_command=True
 )
-console = Console()
+
+# Above this many contacts the per-node Tree render gets slow,
+# so results are printed as one pre-formatted Panel instead
+_TREE_RESULTS_LIMIT = 200
 
 
 # ============================================================================
 # Helper Functions for Display
 # ============================================================================
 
+def display_contact_results_compact(results, query: str, search_type: str):
+    """Display large contact search results as a single plain-text panel."""
+    def _format_row(name, record) -> str:
+        phones_str = ", ".join(p.value for p in record.phones) if record.phones else "-"
+        return f"{name}  📱 {phones_str}  🏷️  {record.tags_display or '-'}"
+
+    body = "\n".join(_format_row(name, record) for name, record in results)
+    console.print(
+        Panel(
+            Text(body),
+            title=f"[bold cyan]🔍 Found {len(results)} contact(s)[/bold cyan] - '{query}' in {search_type}",
+            border_style="cyan",
+        )
+    )
+
+
 def display_contact_results_tree(results, query: str, search_type: str):
     """Display contact search results in a tree view."""
     if not results:
         console.print(f"[yellow]No contacts found matching '{query}' in {search_type}.[/yellow]")
         return
+
+    if len(results) > _TREE_RESULTS_LIMIT:
+        display_contact_results_compact(results, query, search_type)
+        return
     
     tree = Tree(
         f"[bold cyan]🔍 Found {len(results)} contact(s)[/bold cyan] - '{query}' in {search_type}",
@@ -59,8 +85,8 @@ def display_contact_results_tree(results, query: str, search_type: str):
         if hasattr(record, 'email') and record.email:
             contact_branch.add(f"[cyan]📧 Email: {record.email}[/cyan]")
         
-        if record.tags_list():
-            tags_str = ", ".join(record.tags_list())
+        tags_str = record.tags_display
+        if tags_str:
             contact_branch.add(f"[magenta]🏷️  Tags: {tags_str}[/magenta]")
         
         notes = record.list_notes()
@@ -147,6 +173,12 @@ def _search_contacts_impl(
         console.print(f"[red]Invalid search type '{by}'. Valid types: {valid_types}[/red]")
         raise typer.Exit(1)
     
+    # Nothing to match on - don't scan the address book
+    if search_type in (ContactSearchType.TAGS_ALL, ContactSearchType.TAGS_ANY):
+        if not split_tags_string(query or ""):
+            console.print("[yellow]No tags specified.[/yellow]")
+            return
+    
     results = service.search_contacts(query, search_type)
     display_contact_results_tree(results, query, by)
 
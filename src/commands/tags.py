@@ -7,7 +7,8 @@ Commands act as Controller + View:
 
 import typer
 from dependency_injector.wiring import Provide, inject
-from rich.console import Console
+from rich.text import Text
+from src.utils.console import console
 from typing import List
 from pathlib import Path
 from src.container import Container
@@ -17,7 +18,6 @@ from src.utils.validators import validate_tag, split_tags_string, normalize_tag,
 from src.utils.paths import get_storage_path
 
 app = typer.Typer()
-console = Console()
 
 
 @inject
@@ -37,7 +37,8 @@ def _tag_add_impl(
         service.add_tag(name, n)
         added.append(n)
 
-    console.print(f"[bold green]Tags added to {name}: {', '.join(added)}[/bold green]")
+    # Text skips markup parsing, user input with [brackets] prints as-is
+    console.print(Text(f"Tags added to {name}: {', '.join(added)}", style="bold green"))
 
 @app.command(name="tag-add")
 def tag_add_command(
@@ -65,7 +66,7 @@ def _tag_remove_impl(
     filename: Path = Provide[Container.config.storage.filename], 
 ):
     msg = service.remove_tag(name, tag)
-    console.print(f"[bold green]{msg}[/bold green]")
+    console.print(Text(msg, style="bold green"))
 
 
 @app.command(name="tag-remove")
@@ -87,7 +88,7 @@ def _tag_clear_impl(
     filename: Path = Provide[Container.config.storage.filename], 
 ):
     msg = service.clear_tags(name)
-    console.print(f"[bold green]{msg}[/bold green]")
+    console.print(Text(msg, style="bold green"))
 
 
 @app.command(name="tag-clear")
@@ -106,7 +107,7 @@ def _tag_list_impl(
     service: ContactService = Provide[Container.contact_service],
 ):
     tags = service.list_tags(name)
-    console.print(", ".join(tags) if tags else "(no tags)")
+    console.print(Text(", ".join(tags) if tags else "(no tags)"))
 
 
 @app.command(name="tag-list")
@@ -44,20 +44,25 @@ class Container(containers.DeclarativeContainer):
         filename=config.storage.filename.as_(str)
     )
     
-    # Contact service (factory - business logic layer)
-    contact_service = providers.Factory(
+    # Services are stateless wrappers around the address book singleton,
+    # so they are singletons too: injection hands out the cached instance
+    # instead of building a new service on every command call (every REPL
+    # prompt). Tests still swap them via provider.override(...).
+
+    # Contact service (singleton - business logic layer)
+    contact_service = providers.Singleton(
         ContactService,
         address_book=address_book
     )
     
-    # Note service (factory - note management business logic)
-    note_service = providers.Factory(
+    # Note service (singleton - note management business logic)
+    note_service = providers.Singleton(
         NoteService,
         address_book=address_book
     )
     
-    # Search service (factory - search business logic)
-    search_service = providers.Factory(
+    # Search service (singleton - search business logic)
+    search_service = providers.Singleton(
         SearchService,
         address_book=address_book
     )
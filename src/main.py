@@ -18,7 +18,7 @@ if str(project_root) not in sys.path:
 
 import typer
 import click
-from rich.console import Console
+from src.utils.console import console
 from rich.panel import Panel
 from src.container import Container
 from src.utils.paths import get_storage_path
@@ -29,7 +29,6 @@ app = typer.Typer(
     help="Console bot assistant for managing contacts with names, phone numbers, and birthdays.",
     add_completion=True,
 )
-console = Console()
 
 container = Container()
 container.config.storage.filename.from_value(str(get_storage_path()))
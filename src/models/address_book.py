@@ -207,6 +207,11 @@ class AddressBook(UserDict):
                 result.append((name, rec))
         return result
 
+    def has_group_contacts(self, group_id: str) -> bool:
+        """Whether the given group has at least one contact."""
+        prefix = f"{normalize_group_id(group_id)}:"
+        return any(key.startswith(prefix) for key in self.data)
+
     def iter_all(self) -> list[tuple[str, "Record"]]:
         """Contacts from all groups."""
         result: list[tuple[str, "Record"]] = []
@@ -274,17 +274,29 @@ class Record:
     def tags_list(self) -> list[str]:
         return self.tags.as_list()
 
+    @property
+    def tags_tuple(self) -> tuple[str, ...]:
+        """Tags as a cached tuple (no list copy per call)."""
+        return self.tags.as_tuple()
+
+    @property
+    def tags_display(self) -> str:
+        """Comma-separated tags for display (empty string if none)."""
+        return self.tags.as_string()
+
     def has_tags_all(self, tags: list[str]) -> bool:
         """
         Return True if note has *all* of tags (AND).
         """
-        return all(t in self.tags.as_list() for t in tags)
+        have = self.tags_tuple
+        return all(t in have for t in tags)
 
     def has_tags_any(self, tags: list[str]) -> bool:
         """
         Return True if note has *any* of tags (OR).
         """
-        return any(t in self.tags.as_list() for t in tags)
+        have = self.tags_tuple
+        return any(t in have for t in tags)
 
     # --- Notes API ---
     def add_note(self, name: str, content: str = "") -> None:
@@ -10,6 +10,10 @@ from .field import Field
 class Tags(Field):
     """Domain field holding a normalized, unique list of tags (lowercase)."""
 
+    # cached derived views of value; class defaults also cover old pickles
+    _joined: str | None = None
+    _tuple: tuple[str, ...] | None = None
+
     def __init__(self, value: Iterable[str] | str | None = None) -> None:
         super().__init__([])
         self.value: List[str] = []
@@ -28,9 +32,14 @@ class Tags(Field):
             out.append(n)
         return out
 
+    def _invalidate(self) -> None:
+        self._joined = None
+        self._tuple = None
+
     # public API
     def replace(self, tags: Iterable[str]) -> None:
         self.value = self._normalize_many(tags)
+        self._invalidate()
 
     def add(self, tag: str) -> None:
         n = normalize_tag(tag)
@@ -38,14 +47,29 @@ class Tags(Field):
             raise ValueError(f"Invalid tag: '{tag}'")
         if n not in self.value:
             self.value.append(n)
+            self._invalidate()
 
     def remove(self, tag: str) -> None:
         n = normalize_tag(tag)
         if n in self.value:
             self.value.remove(n)
+            self._invalidate()
 
     def clear(self) -> None:
         self.value = []
+        self._invalidate()
 
     def as_list(self) -> List[str]:
         return list(self.value)
+
+    def as_string(self) -> str:
+        """Comma-separated tags, cached until the tags change."""
+        if self._joined is None:
+            self._joined = ", ".join(self.value)
+        return self._joined
+
+    def as_tuple(self) -> tuple[str, ...]:
+        """Read-only tags, cached until the tags change."""
+        if self._tuple is None:
+            self._tuple = tuple(self.value)
+        return self._tuple
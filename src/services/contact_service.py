@@ -16,7 +16,6 @@ from src.models.record import Record
 from src.models.tags import Tags
 from src.models.group import Group, DEFAULT_GROUP_ID, normalize_group_id
 from src.utils.validators import is_valid_tag, normalize_tag, split_tags_string
-from rich.tree import Tree
 
 class ContactSortBy(str, Enum):
     """
@@ -65,11 +64,11 @@ class ContactService:
             False,
         ),
         ContactSortBy.TAG_COUNT: (
-            lambda kv: len(kv[1].tags_list()),
+            lambda kv: len(kv[1].tags_tuple),
             True,  # descending
         ),
         ContactSortBy.TAG_NAME: (
-            lambda kv: ",".join(kv[1].tags_list()).lower(),
+            lambda kv: ",".join(kv[1].tags_tuple).lower(),
             False,
         ),
     }    
@@ -269,11 +268,9 @@ class ContactService:
         if not upcoming:
             return "No upcoming birthdays in the next week."
 
-        result = []
-        for entry in upcoming:
-            result.append(f"{entry['name']}: {entry['congratulation_date']}")
-
-        return "\n".join(result)
+        return "\n".join(
+            f"{entry['name']}: {entry['congratulation_date']}" for entry in upcoming
+        )
 
     def _calculate_upcoming_birthdays(self, days: int = 7) -> list[dict]:
         """
@@ -329,8 +326,12 @@ class ContactService:
         Returns:
             True if current group has contacts, False otherwise
         """
-        # Use list_contacts to ensure consistency with group filtering
-        return len(self.list_contacts()) > 0
+        # Same group check as list_contacts, but stops at the first contact
+        # instead of building and sorting the whole list
+        gid = self.address_book.current_group_id
+        if not self.address_book.has_group(gid):
+            raise ValueError(f"Group '{gid}' not found")
+        return self.address_book.has_group_contacts(gid)
 
     def list_contacts(
             self, 
@@ -365,7 +366,9 @@ class ContactService:
             sorting[self.DEFAULT_SORT_BY],
         )
 
-        items.sort(key=key_fn, reverse=reverse)
+        # nothing to order for 0/1 contacts
+        if len(items) > 1:
+            items.sort(key=key_fn, reverse=reverse)
         return items
 
     # --- Tags management ---
@@ -506,7 +509,7 @@ class ContactService:
             return []
         result: List[Tuple[str, "Record"]] = []
         for name, rec in self._iter_name_record():
-            have = set(rec.tags_list())
+            have = set(rec.tags_tuple)
             if want.issubset(have):
                 result.append((name, rec))
         return result
@@ -526,7 +529,7 @@ class ContactService:
             return []
         result: List[Tuple[str, "Record"]] = []
         for name, rec in self._iter_name_record():
-            have = set(rec.tags_list())
+            have = set(rec.tags_tuple)
             if want & have:
                 result.append((name, rec))
         return result
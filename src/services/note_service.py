@@ -9,6 +9,7 @@ from typing import List
 
 from src.models.address_book import AddressBook
 from src.models.note import Note
+from src.models.record import Record
 from src.models.group import DEFAULT_GROUP_ID
 from src.utils.validators import is_valid_tag, normalize_tag
 
@@ -21,6 +22,8 @@ class NoteService:
     including CRUD operations and tag management for notes.
     """
     
+    __slots__ = ("address_book",)
+    
     def __init__(self, address_book: AddressBook):
         """
         Initialize the note service.
@@ -68,6 +71,24 @@ class NoteService:
             result.append((name, phones_str))
         return sorted(result, key=lambda x: x[0])
     
+    def _get_record(self, contact_name: str) -> Record:
+        """
+        Get a contact record from the current group.
+        
+        Args:
+            contact_name: Contact name
+            
+        Returns:
+            Record object
+            
+        Raises:
+            ValueError: If contact not found
+        """
+        record = self.address_book.find(contact_name)
+        if record is None:
+            raise ValueError(f"Contact '{contact_name}' not found.")
+        return record
+    
     # --- Notes management ---
     
     def add_note(self, contact_name: str, note_name: str, content: str = "") -> str:
@@ -85,9 +106,7 @@ class NoteService:
         Raises:
             ValueError: If contact not found or note already exists
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         record.add_note(note_name, content)
         return f"Note '{note_name}' added to {contact_name}."
@@ -107,9 +126,7 @@ class NoteService:
         Raises:
             ValueError: If contact or note not found
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         record.edit_note(note_name, content)
         return f"Note '{note_name}' updated for {contact_name}."
@@ -128,9 +145,7 @@ class NoteService:
         Raises:
             ValueError: If contact or note not found
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         record.delete_note(note_name)
         return f"Note '{note_name}' deleted from {contact_name}."
@@ -148,9 +163,7 @@ class NoteService:
         Raises:
             ValueError: If contact not found
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         return record.list_notes()
     
@@ -168,9 +181,7 @@ class NoteService:
         Raises:
             ValueError: If contact or note not found
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         note = record.find_note(note_name)
         if note is None:
@@ -195,9 +206,7 @@ class NoteService:
         Raises:
             ValueError: If contact or note not found, or tag format invalid
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         normalized = normalize_tag(tag)
         if not is_valid_tag(normalized):
@@ -221,9 +230,7 @@ class NoteService:
         Raises:
             ValueError: If contact or note not found
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         normalized = normalize_tag(tag)
         record.note_remove_tag(note_name, normalized)
@@ -243,9 +250,7 @@ class NoteService:
         Raises:
             ValueError: If contact or note not found
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         record.note_clear_tags(note_name)
         return f"All tags cleared from note '{note_name}'."
@@ -264,9 +269,7 @@ class NoteService:
         Raises:
             ValueError: If contact or note not found
         """
-        record = self.address_book.find(contact_name)
-        if record is None:
-            raise ValueError(f"Contact '{contact_name}' not found.")
+        record = self._get_record(contact_name)
         
         return record.note_list_tags(note_name)
 
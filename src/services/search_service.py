@@ -142,6 +142,8 @@ class SearchService:
         if search_type in (ContactSearchType.TAGS_ALL, ContactSearchType.TAGS_ANY):
             # Split by comma and normalize
             search_tags = [tag.strip().lower() for tag in query.split(',') if tag.strip()]
+            if not search_tags:
+                return results
             
             for key, record in self.address_book.data.items():
                 # Filter by current group
@@ -152,7 +154,7 @@ class SearchService:
                 else:
                     name = key
                     
-                contact_tags = [tag.lower() for tag in record.tags_list()]
+                contact_tags = [tag.lower() for tag in record.tags_tuple]
                 
                 if search_type == ContactSearchType.TAGS_ALL:
                     # ALL tags must be present (AND logic)
@@ -181,7 +183,7 @@ class SearchService:
                 # Search across all fields
                 if (query_lower in name.lower() or
                     any(query_lower in phone.value for phone in record.phones) or
-                    any(query_lower in tag for tag in record.tags_list()) or
+                    any(query_lower in tag for tag in record.tags_tuple) or
                     any(query_lower in note.content.lower() for note in record.list_notes()) or
                     any(query_lower in note.name.lower() for note in record.list_notes()) or
                     any(query_lower in tag for note in record.list_notes() for tag in note.tags_list())):
@@ -196,7 +198,7 @@ class SearchService:
                     match = True
             
             elif search_type == ContactSearchType.TAGS:
-                if any(query_lower in tag for tag in record.tags_list()):
+                if any(query_lower in tag for tag in record.tags_tuple):
                     match = True
             
             elif search_type == ContactSearchType.NOTES_TEXT:
@@ -252,7 +254,7 @@ class SearchService:
                         any(query_lower in tag for tag in note.tags_list()) or
                         query_lower in contact_name.lower() or
                         any(query_lower in phone.value for phone in record.phones) or
-                        any(query_lower in tag for tag in record.tags_list())):
+                        any(query_lower in tag for tag in record.tags_tuple)):
                         match = True
                 
                 elif search_type == NoteSearchType.NAME:
@@ -276,7 +278,7 @@ class SearchService:
                         match = True
                 
                 elif search_type == NoteSearchType.CONTACT_TAGS:
-                    if any(query_lower in tag for tag in record.tags_list()):
+                    if any(query_lower in tag for tag in record.tags_tuple):
                         match = True
                 
                 if match:
@@ -27,9 +27,8 @@ from functools import wraps
 from typing import Callable, Any
 
 import typer
-from rich.console import Console
+from src.utils.console import console
 
-console = Console()
 
 
 def _is_interactive_mode() -> bool:
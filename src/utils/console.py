@@ -0,0 +1,10 @@
+"""
+Shared Rich console.
+
+Creating a Console probes the terminal (size, color support), so commands
+import this single instance instead of building their own at import time.
+"""
+
+from rich.console import Console
+
+console = Console()
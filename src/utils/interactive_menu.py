@@ -14,9 +14,8 @@ Usage:
 from typing import Dict, Callable, Optional, Any
 import typer
 import questionary
-from rich.console import Console
+from src.utils.console import console
 
-console = Console()
 
 
 class MenuRegistry:
@@ -27,7 +27,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Callable, Optional, TypeVar
 
 import questionary
-from rich.console import Console
+from src.utils.console import console
 from typing import TYPE_CHECKING
 from dependency_injector.wiring import Provide, inject
 
@@ -35,7 +35,6 @@ if TYPE_CHECKING:
     from src.services.note_service import NoteService
     from src.container import Container
 
-console = Console()
 F = TypeVar('F', bound=Callable[..., Any])
 
 
@@ -15,7 +15,9 @@ Single source of truth: Typer command definitions with autocompletion=... argume
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
-from typing import Iterable, List, Optional
+from bisect import bisect_left
+from typing import Callable, Iterable, List, Optional
+from weakref import WeakKeyDictionary
 import click
 import re
 
@@ -40,8 +42,118 @@ class ContextAwareCompleter(Completer):
             click_ctx: Click context (to inspect command structure)
         """
         self.original_completer = original_completer
+        # command path (words) -> resolved subcommand
+        self._nav_cache: dict[tuple[str, ...], click.Command] = {}
+        # command -> its positional arguments
+        self._args_cache: dict[click.Command, List[click.Argument]] = {}
+        # group -> sorted [(lowercase_name, list_commands index, name)] of its subcommands
+        self._names_cache: WeakKeyDictionary = WeakKeyDictionary()
+        # parameter -> its autocompletion callback (or None)
+        self._ac_cache: dict[click.Parameter, Optional[Callable]] = {}
+        # (cache_key, line, prefix, texts, first-letter buckets) of the last callback call
+        self._suggest_cache: Optional[tuple] = None
         self.click_ctx = click_ctx
     
+    @property
+    def click_ctx(self):
+        """Click context used to inspect the command structure."""
+        return self._click_ctx
+    
+    @click_ctx.setter
+    def click_ctx(self, value) -> None:
+        # Cached navigation belongs to the old command tree
+        self._click_ctx = value
+        self._nav_cache.clear()
+        self._args_cache.clear()
+        self._names_cache.clear()
+        self._ac_cache.clear()
+        self._suggest_cache = None
+    
+    def _navigate(self, ctx, words: List[str]) -> tuple:
+        """
+        Walk the command tree along the typed words.
+        
+        Resolved subcommands are cached by their word path, so repeated
+        keystrokes skip Click's get_command lookups.
+        
+        Args:
+            ctx: Click context
+            words: Words typed so far
+            
+        Returns:
+            Tuple (current_cmd, word_idx) - deepest resolved command and
+            index of the first word that was not consumed as a subcommand
+        """
+        current_cmd = ctx.command
+        word_idx = 0
+        while word_idx < len(words) and isinstance(current_cmd, click.MultiCommand):
+            path = tuple(words[:word_idx + 1])
+            subcommand = self._nav_cache.get(path)
+            if subcommand is None:
+                subcommand = current_cmd.get_command(ctx, words[word_idx])
+                if not subcommand:
+                    break
+                self._nav_cache[path] = subcommand
+            current_cmd = subcommand
+            word_idx += 1
+        return current_cmd, word_idx
+    
+    def _match_subcommands(self, ctx, cmd: click.MultiCommand, prefix: str) -> List[str]:
+        """
+        Get subcommand names starting with prefix (case-insensitive).
+        
+        Lowercased names are sorted once per command, so each keystroke
+        is a binary search plus a scan over the matching names only.
+        Matches are returned in list_commands() order, like the other
+        subcommand completions.
+        
+        Args:
+            ctx: Click context
+            cmd: Group whose subcommands are matched
+            prefix: Partially typed subcommand name
+            
+        Returns:
+            Matching subcommand names
+        """
+        names = self._names_cache.get(cmd)
+        if names is None:
+            names = sorted(
+                (name.lower(), index, name)
+                for index, name in enumerate(cmd.list_commands(ctx))
+            )
+            self._names_cache[cmd] = names
+        
+        prefix = prefix.lower()
+        matches = []
+        for lowered, index, name in names[bisect_left(names, (prefix,)):]:
+            if not lowered.startswith(prefix):
+                break
+            matches.append((index, name))
+        matches.sort()
+        return [name for _, name in matches]
+    
+    def _get_autocomplete(self, param: click.Parameter) -> Optional[Callable]:
+        """
+        Get the autocompletion callback of a parameter (cached per parameter).
+        
+        Typer stores custom callbacks in _custom_shell_complete, plain Click
+        arguments may use the autocompletion attribute.
+        """
+        if param not in self._ac_cache:
+            self._ac_cache[param] = (
+                getattr(param, "_custom_shell_complete", None)
+                or getattr(param, "autocompletion", None)
+            )
+        return self._ac_cache[param]
+    
+    def _get_arguments(self, cmd: click.Command) -> List[click.Argument]:
+        """Get positional arguments of a command (cached per command)."""
+        arguments = self._args_cache.get(cmd)
+        if arguments is None:
+            arguments = [p for p in cmd.params if isinstance(p, click.Argument)]
+            self._args_cache[cmd] = arguments
+        return arguments
+    
     def get_completions(self, document: Document, complete_event) -> Iterable[Completion]:
         """
         Get completions with correct parameter position tracking.
@@ -91,33 +203,23 @@ class ContextAwareCompleter(Completer):
         # If typing first word (command), show matching command completions
         if len(words) == 1 and not stripped_text.endswith(' '):
             if isinstance(command, click.MultiCommand):
-                partial_cmd = words[0].lower()
-                for name in command.list_commands(ctx):
-                    if name.lower().startswith(partial_cmd):
-                        yield Completion(name, start_position=-len(words[0]))
+                for name in self._match_subcommands(ctx, command, words[0]):
+                    yield Completion(name, start_position=-len(words[0]))
             return
         
-        # Track position in words array as we navigate command structure
-        current_cmd = command
-        
         # For multi-level commands like "notes add", navigate to the final command
-        word_idx = 0
-        while word_idx < len(words) and isinstance(current_cmd, click.MultiCommand):
+        # word_idx tracks position in words array after navigation
+        current_cmd, word_idx = self._navigate(ctx, words)
+        
+        if word_idx < len(words) and isinstance(current_cmd, click.MultiCommand):
+            # Can't resolve this word as a subcommand
             word = words[word_idx]
-            subcommand = current_cmd.get_command(ctx, word)
-            if subcommand:
-                current_cmd = subcommand
-                word_idx += 1
-            else:
-                # Can't resolve this word as a subcommand
-                # If we're typing the last word, show subcommand completions
-                if word_idx == len(words) - 1 and not stripped_text.endswith(' '):
-                    # Show available subcommands from current_cmd
-                    if isinstance(current_cmd, click.MultiCommand):
-                        for name in current_cmd.list_commands(ctx):
-                            if name.lower().startswith(word.lower()):
-                                yield Completion(name, start_position=-len(word))
-                return
+            # If we're typing the last word, show subcommand completions
+            if word_idx == len(words) - 1 and not stripped_text.endswith(' '):
+                # Show available subcommands from current_cmd
+                for name in self._match_subcommands(ctx, current_cmd, word):
+                    yield Completion(name, start_position=-len(word))
+            return
         
         # After navigation, check if we're still at a MultiCommand level
         # If yes and text ends with space, show subcommands
@@ -150,7 +252,7 @@ class ContextAwareCompleter(Completer):
             return
         
         # Get the parameter at this position from the Click command
-        params = [p for p in current_cmd.params if isinstance(p, click.Argument)]
+        params = self._get_arguments(current_cmd)
         
         if param_index >= len(params):
             # Beyond defined parameters, no completion
@@ -159,12 +261,7 @@ class ContextAwareCompleter(Completer):
         param = params[param_index]
         
         # Extract autocompletion callback from parameter
-        # Typer stores custom callbacks in _custom_shell_complete
-        autocomplete_fn = None
-        if hasattr(param, '_custom_shell_complete'):
-            autocomplete_fn = param._custom_shell_complete
-        elif hasattr(param, 'autocompletion') and param.autocompletion:
-            autocomplete_fn = param.autocompletion
+        autocomplete_fn = self._get_autocomplete(param)
         
         if not autocomplete_fn:
             # No autocomplete defined for this parameter - show nothing
@@ -188,27 +285,75 @@ class ContextAwareCompleter(Completer):
         fake_ctx = click.Context(current_cmd)
         fake_ctx.params = ctx_params
         
-        # Call the autocomplete function
+        # Call the autocomplete function (or reuse its cached result)
         # Signature: (ctx, args, incomplete) -> List[CompletionItem] or List[str]
+        cache_key = (param, tuple(ctx_params.items()))
         try:
-            suggestions = autocomplete_fn(fake_ctx, [], current_word)
-            if suggestions:
-                for suggestion in suggestions:
-                    # Handle both CompletionItem objects and strings
-                    if hasattr(suggestion, 'value'):
-                        # It's a CompletionItem
-                        text = suggestion.value
-                    elif isinstance(suggestion, str):
-                        text = suggestion
-                    else:
-                        continue
-                    
-                    # Filter by current word
-                    if text.lower().startswith(current_word.lower()):
-                        yield Completion(text, start_position=-len(current_word))
-        except Exception as e:
+            texts = self._get_suggestions(cache_key, autocomplete_fn, fake_ctx, current_word, stripped_text)
+        except Exception:
             # If autocomplete fails, don't show anything
-            pass
+            return
+        
+        for text in texts:
+            # Filter by current word
+            if text.lower().startswith(current_word.lower()):
+                yield Completion(text, start_position=-len(current_word))
+    
+    def invalidate_suggestions(self) -> None:
+        """Drop cached callback results, e.g. after a command changed the data."""
+        self._suggest_cache = None
+    
+    def _get_suggestions(
+            self, cache_key, autocomplete_fn, fake_ctx, current_word: str, line: str
+        ) -> List[str]:
+        """
+        Get suggestion texts for the word being typed.
+        
+        The callback result is cached and bucketed by first letter while the
+        user keeps extending the same line, so each keystroke only filters one
+        bucket. A new word (empty current_word), another parameter/context or
+        a line that does not extend the cached one calls the callback again.
+        The REPL also drops the cache after every command, see
+        invalidate_suggestions().
+        
+        Args:
+            cache_key: Parameter plus previously entered parameter values
+            autocomplete_fn: Autocompletion callback of the parameter
+            fake_ctx: Click context passed to the callback
+            current_word: Word being typed
+            line: Input text before the cursor (without the prompt)
+            
+        Returns:
+            Candidate texts (not yet filtered by current_word)
+        """
+        prefix = current_word.lower()
+        cached = self._suggest_cache
+        if (
+            cached is None
+            or not prefix
+            or cached[0] != cache_key
+            or not line.startswith(cached[1])
+            or not prefix.startswith(cached[2])
+        ):
+            texts: List[str] = []
+            buckets: dict[str, List[str]] = {}
+            for suggestion in autocomplete_fn(fake_ctx, [], current_word) or []:
+                # Handle both CompletionItem objects and strings
+                if hasattr(suggestion, 'value'):
+                    # It's a CompletionItem
+                    text = suggestion.value
+                elif isinstance(suggestion, str):
+                    text = suggestion
+                else:
+                    continue
+                texts.append(text)
+                buckets.setdefault(text[:1].lower(), []).append(text)
+            cached = self._suggest_cache = (cache_key, line, prefix, texts, buckets)
+        
+        _, _, _, texts, buckets = cached
+        if not prefix:
+            return texts
+        return buckets.get(prefix[0], [])
 
 
 def create_context_aware_completer(click_completer, click_ctx=None):
@@ -243,9 +388,19 @@ def create_context_aware_completer_for_repl(click_ctx):
         # ClickCompleter expects (cli, ctx_args) where cli is the command
         # and ctx_args is a dictionary of context arguments
         click_completer = ClickCompleter(click_ctx.command, {})
-        return ContextAwareCompleter(click_completer, click_ctx)
+        completer = ContextAwareCompleter(click_completer, click_ctx)
     except Exception:
         # If ClickCompleter instantiation fails, use a minimal completer
         # that only does our custom completion
-        return ContextAwareCompleter(None, click_ctx)
+        completer = ContextAwareCompleter(None, click_ctx)
+    
+    # Commands may add/remove contacts, so cached suggestions must not
+    # survive into the next prompt
+    if click_ctx is not None and isinstance(click_ctx.command, click.Group):
+        @click_ctx.command.result_callback()
+        def _invalidate_suggestions(result, *args, **kwargs):
+            completer.invalidate_suggestions()
+            return result
+    
+    return completer
 
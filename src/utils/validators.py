@@ -20,12 +20,16 @@ Example:
 
 import re
 import typer
-from datetime import datetime, date
+from datetime import date
+from functools import lru_cache
 from src.models.phone import Phone
 
 _ACEPTED_PHONE_LEN = 10
 _MAX_AGE_YEARS = 120
 _BDAY_FMT = "%d.%m.%Y"
+# same shapes strptime accepts for _BDAY_FMT (1-2 digit day/month, 4 digit year)
+_BDAY_RE = re.compile(r"([0-9]{1,2})\.([0-9]{1,2})\.([0-9]{4})")
+_BDAY_ERROR = "Invalid date. Use DD.MM.YYYY (e.g., 25.12.1990)"
 _EMAIL_RE = re.compile(r"^(?P<local>[A-Za-z0-9._%+-]+)@(?P<domain>[A-Za-z0-9.-]+\.[A-Za-z]{2,24})$")
 
 def validate_phone(value: str) -> str:
@@ -35,11 +39,16 @@ def validate_phone(value: str) -> str:
         raise typer.BadParameter("Phone number cannot be empty")
 
     try:
-        phone = Phone(raw)
+        return _canonical_phone(raw)
     except ValueError as exc:
         raise typer.BadParameter(str(exc)) from exc
 
-    return phone.value
+
+@lru_cache(maxsize=1024)
+def _canonical_phone(raw: str) -> str:
+    # phonenumbers parsing + formatting is the expensive part, repeated
+    # numbers (REPL, batch adds) reuse the result; errors are not cached
+    return Phone(raw).value
 
 
 def validate_birthday(value: str) -> str:
@@ -57,12 +66,15 @@ def validate_birthday(value: str) -> str:
     """
     raw = (value or "").strip()
 
+    # regex + date() constructor instead of strptime's format parsing
+    m = _BDAY_RE.fullmatch(raw)
+    if not m:
+        raise typer.BadParameter(_BDAY_ERROR)
+    day, month, year = map(int, m.groups())
     try:
-        bday = datetime.strptime(raw, _BDAY_FMT).date()
+        bday = date(year, month, day)
     except ValueError:
-        raise typer.BadParameter(
-            "Invalid date. Use DD.MM.YYYY (e.g., 25.12.1990)"
-        )
+        raise typer.BadParameter(_BDAY_ERROR)
 
     today = date.today()
 
@@ -144,14 +156,19 @@ def validate_email(value: str) -> str:
 # Tag validation utilities
 
 import re
+import string
 # splitting strings with commas safely
 import csv
 from io import StringIO
 
-# Regular expression for valid tags: lowercase letters, digits, underscores, hyphens, 1-32 chars
-_TAG_RE = re.compile(r"^[a-z0-9_,\-]{1,32}$")
+# Valid tags: lowercase letters, digits, underscores, commas, hyphens, 1-32 chars
+_TAG_MAX_LEN = 32
+_TAG_CHARS = frozenset(string.ascii_lowercase + string.digits + "_,-")
+# characters that need the csv reader when splitting tag strings
+_CSV_SPECIAL_CHARS = ('"', "\n", "\r")
 
 
+@lru_cache(maxsize=4096)
 def normalize_tag(tag: str) -> str:
     """
     Normalize a tag by trimming whitespace, collapsing spaces, and converting to lowercase.
@@ -160,12 +177,13 @@ def normalize_tag(tag: str) -> str:
     return " ".join(tag.strip().split()).lower()
 
 
+@lru_cache(maxsize=4096)
 def is_valid_tag(tag: str) -> bool:
     """
     Check if a tag is valid according to the defined pattern.
     """
-    # empty tags already handled in normalize_tag
-    return bool(tag) and bool(_TAG_RE.match(tag))
+    # set lookup runs in C, no need to go through the regex engine
+    return 0 < len(tag) <= _TAG_MAX_LEN and _TAG_CHARS.issuperset(tag)
 
 
 def split_tags_string(s: str) -> list[str]:
@@ -181,9 +199,20 @@ def split_tags_string(s: str) -> list[str]:
     # "ai, ML" ,  python -> ["ai, ML", "python"] (without normalization)
     if not s or not s.strip():
         return []
+    # cached as a tuple, callers get their own list to mutate
+    return list(_split_tags_cached(s))
+
+
+@lru_cache(maxsize=1024)
+def _split_tags_cached(s: str) -> tuple[str, ...]:
+    if not any(c in s for c in _CSV_SPECIAL_CHARS):
+        # no quoting or line breaks -> plain split gives the same result as csv
+        if "," not in s:
+            return (s.strip(),)
+        return tuple(t for t in map(str.strip, s.split(",")) if t)
     reader = csv.reader(StringIO(s), skipinitialspace=True)
     row = next(reader, [])
-    return [t.strip() for t in row if t and t.strip()]
+    return tuple(t.strip() for t in row if t and t.strip())
 
 
 def validate_tag(value: str) -> str:
@@ -0,0 +1,25 @@
+"""
+Shared helpers for the test suite.
+"""
+
+from src.models.address_book import AddressBook
+from src.models.record import Record
+
+
+def build_book(specs):
+    """
+    Build an address book from (name, phone, birthday, tags) tuples.
+
+    phone and birthday may be None, tags may be None or an iterable of tags.
+    """
+    book = AddressBook()
+    for name, phone, birthday, tags in specs:
+        record = Record(name)
+        if phone:
+            record.add_phone(phone)
+        if birthday:
+            record.add_birthday(birthday)
+        for tag in tags or ():
+            record.add_tag(tag)
+        book.add_record(record)
+    return book
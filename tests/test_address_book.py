@@ -216,4 +216,13 @@ def test_remove_current_group_switches_to_personal():
     book.remove_group("work")
 
     assert book.current_group_id == "personal"
-    assert "work" not in book.groups
\ No newline at end of file
+    assert "work" not in book.groups
+
+def test_has_group_contacts():
+    book = AddressBook()
+    book.add_group("work")
+    book.add_record(Record("John"))
+
+    assert book.has_group_contacts("personal") is True
+    assert book.has_group_contacts(" Personal ") is True
+    assert book.has_group_contacts("work") is False
@@ -267,13 +267,14 @@ class TestAutocompleteErrorHandling:
     def test_complete_contact_name_impl_handles_exceptions(self, monkeypatch):
         """Test that exceptions are caught and empty list returned."""
         # Create service that will raise exception
+        # (NoteService uses __slots__, so methods are patched on the class)
         bad_service = NoteService(AddressBook())
         
         # Mock has_contacts to raise exception
-        def bad_has_contacts():
+        def bad_has_contacts(self):
             raise RuntimeError("Test error")
         
-        monkeypatch.setattr(bad_service, "has_contacts", bad_has_contacts)
+        monkeypatch.setattr(NoteService, "has_contacts", bad_has_contacts)
         
         result = _complete_contact_name_impl("", service=bad_service)
         assert result == []
@@ -283,10 +284,10 @@ class TestAutocompleteErrorHandling:
         bad_service = NoteService(AddressBook())
         
         # Mock list_contacts to raise exception
-        def bad_list_contacts():
+        def bad_list_contacts(self):
             raise RuntimeError("Test error")
         
-        monkeypatch.setattr(bad_service, "list_contacts", bad_list_contacts)
+        monkeypatch.setattr(NoteService, "list_contacts", bad_list_contacts)
         
         result = _complete_note_name_impl("", None, service=bad_service)
         assert result == []
@@ -296,10 +297,10 @@ class TestAutocompleteErrorHandling:
         bad_service = NoteService(AddressBook())
         
         # Mock list_contacts to raise exception
-        def bad_list_contacts():
+        def bad_list_contacts(self):
             raise RuntimeError("Test error")
         
-        monkeypatch.setattr(bad_service, "list_contacts", bad_list_contacts)
+        monkeypatch.setattr(NoteService, "list_contacts", bad_list_contacts)
         
         result = _complete_tag_impl("", None, None, service=bad_service)
         assert result == []
@@ -39,6 +39,16 @@ class TestGroupsCLI:
         assert r.exit_code == 0
         assert "personal" in r.stdout
 
+    def test_group_list_marks_current(self, mock_service):
+        mock_service.list_groups.return_value = [("personal", 2), ("work", 1)]
+        mock_service.get_current_group.return_value = "work"
+
+        with container.contact_service.override(mock_service):
+            r = runner.invoke(app, ["group-list"])
+        assert r.exit_code == 0
+        work_row = next(line for line in r.stdout.splitlines() if "work" in line)
+        assert "1" in work_row and "●" in work_row
+
     def test_group_add_creates(self, mock_service):
         with container.contact_service.override(mock_service):
             r = runner.invoke(app, ["group-add", "work"])
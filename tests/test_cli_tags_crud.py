@@ -81,3 +81,10 @@ class TestTagsCRUD:
         assert "cleared" in r.stdout.lower()
         mock_service.clear_tags.assert_called_once_with("Pavlo")
         mock_service.address_book.save_to_file.assert_called_once()
+
+    def test_tag_clear_prints_brackets_literally(self, mock_service):
+        mock_service.clear_tags.return_value = "All tags cleared for [bold]Pavlo[/bold]."
+        with container.contact_service.override(mock_service):
+            r = runner.invoke(app, ["tag-clear", "[bold]Pavlo[/bold]"])
+        assert r.exit_code == 0
+        assert "[bold]Pavlo[/bold]" in r.stdout
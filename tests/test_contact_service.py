@@ -4,17 +4,50 @@ Tests for ContactService.
 This module contains comprehensive tests for all contact service operations.
 """
 
+import re
 import sys
 import os
 # Ensure the project root is on sys.path so `src.*` imports work when running tests
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pytest
+from copy import deepcopy
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from src.models.address_book import AddressBook
-from src.models.record import Record
+import src.services.contact_service as contact_service_module
 from src.services.contact_service import ContactService, ContactSortBy
 from src.models.group import DEFAULT_GROUP_ID
+from tests.helpers import build_book
+
+
+NOT_FOUND_RE = re.compile("not found")
+INVALID_TAG_RE = re.compile("Invalid tag")
+
+
+# A Wednesday, so the coming Saturday is always three days away
+FROZEN_TODAY = datetime(2024, 3, 13)
+
+
+class FrozenDateTime(datetime):
+    """datetime whose today() always returns FROZEN_TODAY."""
+
+    @classmethod
+    def today(cls):
+        return FROZEN_TODAY
+
+
+@pytest.fixture
+def frozen_today(monkeypatch):
+    """Freeze the clock seen by contact_service and return the frozen date."""
+    monkeypatch.setattr(contact_service_module, "datetime", FrozenDateTime)
+    return FROZEN_TODAY.date()
+
+
+@pytest.fixture
+def make_birthday(frozen_today):
+    """Return a factory formatting the date `offset` days from the frozen today as a birthday."""
+    return lambda offset: (frozen_today + timedelta(days=offset)).strftime("%d.%m.2000")
 
 
 @pytest.fixture
@@ -29,40 +62,38 @@ def contact_service(address_book):
     return ContactService(address_book)
 
 
+@pytest.fixture(scope="module")
+def _populated_book_template():
+    """Build the single-contact address book once per module."""
+    return build_book([("John", "1234567890", "15.05.1990", None)])
+
+
 @pytest.fixture
-def populated_service():
+def populated_service(_populated_book_template):
     """Create a contact service with some test data."""
-    book = AddressBook()
-    record = Record("John")
-    record.add_phone("1234567890")
-    record.add_birthday("15.05.1990")
-    book.add_record(record)
-    return ContactService(book)
+    return ContactService(deepcopy(_populated_book_template))
 
-@pytest.fixture
-def sorting_service():
-    """Create a contact service with multiple contacts for sorting tests."""
-    book = AddressBook()
 
-    pavlo = Record("Pavlo")
-    pavlo.add_phone("3333333333")
-    pavlo.add_birthday("15.05.1990")
-    pavlo.add_tag("ml")
-    pavlo.add_tag("ai")
-    book.add_record(pavlo)
+@pytest.fixture(scope="module")
+def _sorting_book_template():
+    """Build the multi-contact address book once per module."""
+    return build_book([
+        ("Pavlo", "3333333333", "15.05.1990", ["ml", "ai"]),
+        ("Anna", "1111111111", "01.01.1980", ["ai"]),
+        ("Illia", "2222222222", None, None),  # no birthday, no tags
+    ])
 
-    anna = Record("Anna")
-    anna.add_phone("1111111111")
-    anna.add_birthday("01.01.1980")
-    anna.add_tag("ai")
-    book.add_record(anna)
 
-    illia = Record("Illia")
-    illia.add_phone("2222222222")
-    # no birthday, no tags
-    book.add_record(illia)
+@pytest.fixture
+def sorting_service(_sorting_book_template):
+    """Create a contact service with multiple contacts for tests that mutate them."""
+    return ContactService(deepcopy(_sorting_book_template))
+
 
-    return ContactService(book)
+@pytest.fixture(scope="module")
+def readonly_sorting_service(_sorting_book_template):
+    """Shared contact service over the sorting book; tests must not mutate it."""
+    return ContactService(_sorting_book_template)
 
 
 class TestAddContact:
@@ -106,7 +137,7 @@ class TestDeleteContact:
 
     def test_delete_non_existent_contact(self, contact_service):
         """Test deleting a non-existent contact."""
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             contact_service.delete_contact("NonExistent")
 
     def test_delete_contact_with_phones(self, populated_service):
@@ -131,11 +162,6 @@ class TestChangeContact:
         assert record.find_phone("0987654321") is not None
         assert record.find_phone("1234567890") is None
     
-    def test_change_phone_contact_not_found(self, contact_service):
-        """Test changing phone for non-existent contact."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.change_contact("NonExistent", "1234567890", "0987654321")
-    
     def test_change_phone_number_not_found(self, populated_service):
         """Test changing a phone number that doesn't exist."""
         with pytest.raises(ValueError):
@@ -150,16 +176,9 @@ class TestGetPhone:
         result = populated_service.get_phone("John")
         assert "1234567890" in result
     
-    def test_get_phone_contact_not_found(self, contact_service):
-        """Test getting phone for non-existent contact."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.get_phone("NonExistent")
-    
-    def test_get_phone_no_phones(self, contact_service):
+    def test_get_phone_no_phones(self):
         """Test getting phone for contact with no phones."""
-        service = contact_service
-        record = Record("NoPhone")
-        service.address_book.add_record(record)
+        service = ContactService(build_book([("NoPhone", None, None, None)]))
         result = service.get_phone("NoPhone")
         assert "No phones" in result
 
@@ -181,151 +200,117 @@ class TestGetAllContacts:
 class TestBirthday:
     """Tests for birthday-related methods."""
     
+    @pytest.fixture(autouse=True)
+    def _frozen(self, frozen_today):
+        """Run every birthday test against the frozen Wednesday."""
+    
     def test_add_birthday(self, contact_service):
         """Test adding a birthday to a contact."""
         contact_service.add_contact("Alice", "1234567890")
         result = contact_service.add_birthday("Alice", "10.03.1995")
         assert result == "Birthday added."
     
-    def test_add_birthday_contact_not_found(self, contact_service):
-        """Test adding birthday to non-existent contact."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.add_birthday("NonExistent", "10.03.1995")
-    
     def test_add_birthday_invalid_format(self, contact_service):
         """Test adding birthday with invalid format."""
         contact_service.add_contact("Alice", "1234567890")
         with pytest.raises(ValueError):
             contact_service.add_birthday("Alice", "invalid-date")
     
-    def test_get_birthday(self, populated_service):
-        """Test getting birthday for a contact."""
-        result = populated_service.get_birthday("John")
-        assert "15.05.1990" in result
-    
     def test_get_birthday_not_set(self, contact_service):
         """Test getting birthday when not set."""
         contact_service.add_contact("Alice", "1234567890")
         result = contact_service.get_birthday("Alice")
         assert "No birthday set" in result
     
-    def test_get_birthday_contact_not_found(self, contact_service):
-        """Test getting birthday for non-existent contact."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.get_birthday("NonExistent")
-    
     def test_get_upcoming_birthdays_none(self, contact_service):
         """Test getting upcoming birthdays when none exist."""
         result = contact_service.get_upcoming_birthdays()
         assert "No upcoming birthdays" in result
     
-    def test_get_upcoming_birthdays_within_week(self, contact_service):
-        """Test getting birthdays within the next week."""
+    @pytest.mark.parametrize("offset,days,expected", [
+        (5, 7, "John"),
+        (0, 7, "John"),
+        (-1, 7, "No upcoming birthdays"),
+        (8, 7, "No upcoming birthdays"),
+        (10, 7, "No upcoming birthdays"),
+        (10, 14, "John"),
+    ])
+    def test_get_upcoming_birthdays(self, contact_service, make_birthday, offset, days, expected):
+        """Test which birthdays fall inside the upcoming window."""
         contact_service.add_contact("John", "1234567890")
+        contact_service.add_birthday("John", make_birthday(offset))
         
-        today = datetime.today().date()
-        birthday_in_5_days = today + timedelta(days=5)
-        birthday_str = birthday_in_5_days.strftime("%d.%m.2000")
-        
-        contact_service.add_birthday("John", birthday_str)
-        
-        result = contact_service.get_upcoming_birthdays()
-        assert "John" in result
-        assert "No upcoming birthdays" not in result
+        result = contact_service.get_upcoming_birthdays(days=days)
+        assert expected in result
     
-    def test_get_upcoming_birthdays_today(self, contact_service):
-        """Test that get_upcoming_birthdays includes today's birthday."""
-        contact_service.add_contact("John", "1234567890")
-        
-        today = datetime.today().date()
-        birthday_str = today.strftime("%d.%m.2000")
-        
-        contact_service.add_birthday("John", birthday_str)
-        
-        result = contact_service.get_upcoming_birthdays()
-        assert "John" in result
-    
-    def test_get_upcoming_birthdays_past_birthday(self, contact_service):
-        """Test that get_upcoming_birthdays excludes past birthdays."""
-        contact_service.add_contact("John", "1234567890")
-        
-        today = datetime.today().date()
-        birthday_yesterday = today - timedelta(days=1)
-        birthday_str = birthday_yesterday.strftime("%d.%m.2000")
-        
-        contact_service.add_birthday("John", birthday_str)
-        
-        result = contact_service.get_upcoming_birthdays()
-        assert "No upcoming birthdays" in result
-    
-    def test_get_upcoming_birthdays_too_far_in_future(self, contact_service):
-        """Test that get_upcoming_birthdays excludes birthdays more than 7 days away."""
-        contact_service.add_contact("John", "1234567890")
-        
-        today = datetime.today().date()
-        birthday_in_8_days = today + timedelta(days=8)
-        birthday_str = birthday_in_8_days.strftime("%d.%m.2000")
-        
-        contact_service.add_birthday("John", birthday_str)
-        
-        result = contact_service.get_upcoming_birthdays()
-        assert "No upcoming birthdays" in result
-    
-    def test_get_upcoming_birthdays_multiple_contacts(self, contact_service):
+    def test_get_upcoming_birthdays_multiple_contacts(self, make_birthday):
         """Test that get_upcoming_birthdays returns multiple contacts."""
-        today = datetime.today().date()
-        
-        contact_service.add_contact("John", "1234567890")
-        john_birthday = (today + timedelta(days=2)).strftime("%d.%m.2000")
-        contact_service.add_birthday("John", john_birthday)
-        
-        contact_service.add_contact("Jane", "0987654321")
-        jane_birthday = (today + timedelta(days=5)).strftime("%d.%m.2000")
-        contact_service.add_birthday("Jane", jane_birthday)
+        service = ContactService(build_book([
+            ("John", "1234567890", make_birthday(2), None),
+            ("Jane", "0987654321", make_birthday(5), None),
+        ]))
         
-        result = contact_service.get_upcoming_birthdays()
+        result = service.get_upcoming_birthdays()
         assert "John" in result
         assert "Jane" in result
     
-    def test_get_upcoming_birthdays_weekend_adjustment(self, contact_service):
+    def test_get_upcoming_birthdays_weekend_adjustment(self, contact_service, frozen_today):
         """Test that birthdays on weekends are moved to Monday."""
         contact_service.add_contact("John", "1234567890")
         
-        today = datetime.today().date()
-        days_until_saturday = (5 - today.weekday()) % 7
-        if days_until_saturday == 0:
-            days_until_saturday = 7
-        
-        next_saturday = today + timedelta(days=days_until_saturday)
+        next_saturday = frozen_today + timedelta(days=3)
         birthday_str = next_saturday.strftime("%d.%m.2000")
         
-        if days_until_saturday <= 7:
-            contact_service.add_birthday("John", birthday_str)
-            result = contact_service.get_upcoming_birthdays()
-            
-            if "John" in result:
-                lines = result.split('\n')
-                for line in lines:
-                    if "John" in line:
-                        date_str = line.split(': ')[1]
-                        congratulation_date = datetime.strptime(date_str, "%d.%m.%Y").date()
-                        assert congratulation_date.weekday() == 0
-    
-    def test_get_upcoming_birthdays_custom_days(self, contact_service):
-        """Test that get_upcoming_birthdays accepts custom days parameter."""
-        contact_service.add_contact("John", "1234567890")
-        
-        today = datetime.today().date()
-        birthday_in_10_days = today + timedelta(days=10)
-        birthday_str = birthday_in_10_days.strftime("%d.%m.2000")
-        
         contact_service.add_birthday("John", birthday_str)
+        result = contact_service.get_upcoming_birthdays()
         
-        result_7_days = contact_service.get_upcoming_birthdays(days=7)
-        assert "No upcoming birthdays" in result_7_days
-        
-        result_14_days = contact_service.get_upcoming_birthdays(days=14)
-        assert "John" in result_14_days
+        match = re.search(r"John.*?: (\d{2}\.\d{2}\.\d{4})", result)
+        assert match
+        congratulation_date = datetime.strptime(match.group(1), "%d.%m.%Y").date()
+        assert congratulation_date.weekday() == 0
+
+
+@pytest.fixture(scope="class")
+def _birthday_query_service(request, _populated_book_template):
+    """Share one service over a copy of the populated book across a read-only test class."""
+    request.cls.svc = ContactService(deepcopy(_populated_book_template))
+    yield
+    del request.cls.svc
+
+
+@pytest.mark.usefixtures("_birthday_query_service", "frozen_today")
+class TestBirthdayQueries:
+    """Read-only birthday tests sharing one class-scoped service."""
+    
+    def test_get_birthday(self):
+        """Test getting birthday for a contact."""
+        result = self.svc.get_birthday("John")
+        assert "15.05.1990" in result
+    
+    def test_get_upcoming_birthdays_out_of_window(self):
+        """Test getting upcoming birthdays when none fall in the window."""
+        # John's 15.05 birthday is two months after the frozen 13.03
+        result = self.svc.get_upcoming_birthdays()
+        assert "No upcoming birthdays" in result
+
+
+class TestContactNotFound:
+    """Tests for operations on a contact that does not exist."""
+    
+    @pytest.mark.parametrize("op", [
+        pytest.param(lambda s: s.change_contact("NonExistent", "1234567890", "0987654321"), id="change_contact"),
+        pytest.param(lambda s: s.get_phone("NonExistent"), id="get_phone"),
+        pytest.param(lambda s: s.add_birthday("NonExistent", "10.03.1995"), id="add_birthday"),
+        pytest.param(lambda s: s.get_birthday("NonExistent"), id="get_birthday"),
+        pytest.param(lambda s: s.add_tag("NonExistent", "work"), id="add_tag"),
+        pytest.param(lambda s: s.remove_tag("NonExistent", "work"), id="remove_tag"),
+        pytest.param(lambda s: s.clear_tags("NonExistent"), id="clear_tags"),
+        pytest.param(lambda s: s.list_tags("NonExistent"), id="list_tags"),
+    ])
+    def test_not_found(self, contact_service, op):
+        """Test that each operation raises for a non-existent contact."""
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
+            op(contact_service)
 
 
 class TestHasContacts:
@@ -339,42 +324,42 @@ class TestHasContacts:
         """Test has_contacts with populated address book."""
         assert populated_service.has_contacts() is True
 
+    def test_has_contacts_only_in_other_group(self, populated_service):
+        """Test has_contacts ignores contacts outside the current group."""
+        populated_service.add_group("work")
+        populated_service.set_current_group("work")
+        assert populated_service.has_contacts() is False
+
+    def test_has_contacts_missing_current_group_raises(self, contact_service):
+        """Test has_contacts fails like list_contacts for an unknown current group."""
+        contact_service.address_book.current_group_id = "unknown"
+        with pytest.raises(ValueError, match="Group 'unknown' not found"):
+            contact_service.has_contacts()
+
 class TestSorting:
     """Tests for contact sorting logic."""
 
-    def test_list_contacts_sort_by_name(self, sorting_service):
-        """Contacts are sorted alphabetically by name (case-insensitive)."""
-        items = sorting_service.list_contacts(sort_by=ContactSortBy.NAME)
-        names = [name for name, _ in items]
-        assert names == ["Anna", "Illia", "Pavlo"]
-
-    def test_list_contacts_sort_by_phone(self, sorting_service):
-        """Contacts are sorted by first phone number."""
-        items = sorting_service.list_contacts(sort_by=ContactSortBy.PHONE)
-        names = [name for name, _ in items]
+    @pytest.mark.parametrize("sort_by,expected", [
+        # case-insensitive alphabetical order
+        (ContactSortBy.NAME, ["Anna", "Illia", "Pavlo"]),
         # 1111111111 < 2222222222 < 3333333333
-        assert names == ["Anna", "Illia", "Pavlo"]
-
-    def test_list_contacts_sort_by_birthday(self, sorting_service):
-        """Contacts are sorted by birthday, contacts without birthday go last."""
-        items = sorting_service.list_contacts(sort_by=ContactSortBy.BIRTHDAY)
-        names = [name for name, _ in items]
+        (ContactSortBy.PHONE, ["Anna", "Illia", "Pavlo"]),
         # Anna: 01.01.1980, Pavlo: 15.05.1990, Illia: no birthday -> last
-        assert names == ["Anna", "Pavlo", "Illia"]
-
-    def test_list_contacts_sort_by_tag_count(self, sorting_service):
-        """Contacts are sorted by tag count in descending order."""
-        items = sorting_service.list_contacts(sort_by=ContactSortBy.TAG_COUNT)
-        names = [name for name, _ in items]
-        # Pavlo: 2 tags, Anna: 1 tag, Illia: 0 tags
-        assert names == ["Pavlo", "Anna", "Illia"]
-
-    def test_list_contacts_sort_by_tag_name(self, sorting_service):
+        (ContactSortBy.BIRTHDAY, ["Anna", "Pavlo", "Illia"]),
+        # Pavlo: 2 tags, Anna: 1 tag, Illia: 0 tags (descending)
+        (ContactSortBy.TAG_COUNT, ["Pavlo", "Anna", "Illia"]),
+    ])
+    def test_list_contacts_sort_by(self, readonly_sorting_service, sort_by, expected):
+        """Contacts are listed in the order defined by sort_by."""
+        items = readonly_sorting_service.list_contacts(sort_by=sort_by)
+        assert [name for name, _ in items] == expected
+
+    def test_list_contacts_sort_by_tag_name(self, readonly_sorting_service):
         """
         Contacts are sorted by tag names; contacts without tags use empty string
         and therefore go first.
         """
-        items = sorting_service.list_contacts(sort_by=ContactSortBy.TAG_NAME)
+        items = readonly_sorting_service.list_contacts(sort_by=ContactSortBy.TAG_NAME)
         names = [name for name, _ in items]
         # Illia: no tags -> key="", Anna: "ai", Pavlo: "ai,ml"/"ml,ai" -> above Anna
         assert names[0] == "Illia"
@@ -402,8 +387,7 @@ class TestGroupsService:
         """Empty address book has only default group with zero contacts."""
         groups = contact_service.list_groups()
         assert groups  # not empty
-        ids = [gid for gid, _ in groups]
-        assert DEFAULT_GROUP_ID in ids
+        assert any(gid == DEFAULT_GROUP_ID for gid, _ in groups)
         # default has 0 contacts
         default_entry = next((c for c in groups if c[0] == DEFAULT_GROUP_ID), None)
         assert default_entry is not None
@@ -431,7 +415,7 @@ class TestGroupsService:
 
     def test_set_current_group_not_found(self, contact_service):
         """set_current_group fails for unknown group."""
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             contact_service.set_current_group("unknown")
 
     def test_add_contact_uses_current_group_by_default(self, contact_service):
@@ -442,7 +426,7 @@ class TestGroupsService:
         contact_service.add_contact("Alice", "1234567890")
 
         # find created record
-        records = list(contact_service.address_book.data.values())
+        records = contact_service.address_book.data.values()
         rec = next(r for r in records if r.name.value == "Alice")
         assert rec.group_id == "work"
 
@@ -453,7 +437,7 @@ class TestGroupsService:
 
         contact_service.add_contact("Bob", "1234567890", group_id="other")
 
-        records = list(contact_service.address_book.data.values())
+        records = contact_service.address_book.data.values()
         rec = next(r for r in records if r.name.value == "Bob")
         assert rec.group_id == "other"
         # group 'other' should also be registered in address book
@@ -653,8 +637,7 @@ class TestGroupsServiceAPI:
         ab = contact_service.address_book
         assert not ab.has_group("work")
         # no contacts in work group
-        for key in ab.data.keys():
-            assert not key.startswith("work:")
+        assert not any(key.startswith("work:") for key in ab.data)
     
     def test_remove_group_without_force(self, contact_service):
         """Test removing an empty group without force flag."""
@@ -708,171 +691,78 @@ class TestGroupsServiceAPI:
         assert "Address book is empty" in out
 
 
+INVALID_TAGS = ["", "tag@#$"]
+
+
 class TestTagManagement:
     """Tests for tag management methods."""
     
-    def test_add_tag_to_contact(self, populated_service):
-        """Test adding a tag to a contact."""
-        result = populated_service.add_tag("John", "work")
+    @pytest.mark.parametrize("tag", ["work", "Work"])
+    def test_add_tag_to_contact(self, populated_service, tag):
+        """Test adding a tag stores it normalized to lowercase."""
+        result = populated_service.add_tag("John", tag)
         assert "added" in result.lower()
         tags = populated_service.list_tags("John")
-        assert "work" in tags
+        assert tags == ["work"]
     
-    def test_add_tag_normalizes_to_lowercase(self, populated_service):
-        """Test tags are normalized to lowercase."""
-        populated_service.add_tag("John", "Work")
-        tags = populated_service.list_tags("John")
-        assert "work" in tags
-        assert "Work" not in tags
-    
-    def test_add_tag_to_non_existent_contact(self, contact_service):
-        """Test adding tag to non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.add_tag("NonExistent", "work")
-    
-    def test_remove_tag_from_contact(self, populated_service):
-        """Test removing a tag from a contact."""
-        populated_service.add_tag("John", "work")
-        populated_service.add_tag("John", "important")
+    def test_tag_lifecycle(self, populated_service):
+        """Test listing, removing and clearing tags on one contact."""
+        assert populated_service.list_tags("John") == []
+        
+        for tag in ("work", "important", "urgent"):
+            populated_service.add_tag("John", tag)
+        assert sorted(populated_service.list_tags("John")) == ["important", "urgent", "work"]
         
-        result = populated_service.remove_tag("John", "work")
+        # remove_tag normalizes the name and keeps other tags
+        result = populated_service.remove_tag("John", "Work")
         assert "removed" in result.lower()
-        tags = populated_service.list_tags("John")
-        assert "work" not in tags
-        assert "important" in tags
-    
-    def test_remove_tag_normalizes(self, populated_service):
-        """Test remove_tag normalizes tag names."""
-        populated_service.add_tag("John", "work")
-        populated_service.remove_tag("John", "Work")  # Uppercase
-        tags = populated_service.list_tags("John")
-        assert "work" not in tags
-    
-    def test_remove_tag_from_non_existent_contact(self, contact_service):
-        """Test removing tag from non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.remove_tag("NonExistent", "work")
-    
-    def test_clear_tags_from_contact(self, populated_service):
-        """Test clearing all tags from a contact."""
-        populated_service.add_tag("John", "work")
-        populated_service.add_tag("John", "important")
+        assert sorted(populated_service.list_tags("John")) == ["important", "urgent"]
         
         result = populated_service.clear_tags("John")
         assert "cleared" in result.lower()
-        tags = populated_service.list_tags("John")
-        assert tags == []
-    
-    def test_clear_tags_from_non_existent_contact(self, contact_service):
-        """Test clearing tags from non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.clear_tags("NonExistent")
-    
-    def test_list_tags_for_contact(self, populated_service):
-        """Test listing all tags for a contact."""
-        populated_service.add_tag("John", "work")
-        populated_service.add_tag("John", "important")
-        populated_service.add_tag("John", "urgent")
-        
-        tags = populated_service.list_tags("John")
-        assert len(tags) == 3
-        assert "work" in tags
-        assert "important" in tags
-        assert "urgent" in tags
-    
-    def test_list_tags_for_contact_without_tags(self, populated_service):
-        """Test listing tags for contact without tags."""
-        tags = populated_service.list_tags("John")
-        assert tags == []
-    
-    def test_list_tags_for_non_existent_contact(self, contact_service):
-        """Test listing tags for non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
-            contact_service.list_tags("NonExistent")
+        assert populated_service.list_tags("John") == []
     
-    def test_add_invalid_tag_raises_error(self, populated_service):
+    @pytest.mark.parametrize("bad", INVALID_TAGS)
+    def test_add_tag_rejects_invalid(self, populated_service, bad):
         """Test adding invalid tag raises error."""
-        with pytest.raises(ValueError, match="Invalid tag"):
-            populated_service.add_tag("John", "")
-    
-    def test_add_tag_with_special_characters_invalid(self, populated_service):
-        """Test adding tag with invalid special characters raises error."""
-        with pytest.raises(ValueError, match="Invalid tag"):
-            populated_service.add_tag("John", "tag@#$")
+        with pytest.raises(ValueError, match=INVALID_TAG_RE):
+            populated_service.add_tag("John", bad)
 
 
 class TestTagSearch:
     """Tests for tag search methods."""
     
-    def test_find_by_tags_all_with_list(self, sorting_service):
-        """Test finding contacts with all specified tags (list input)."""
+    @pytest.mark.parametrize("tags,expected", [
+        pytest.param(["ml", "ai"], {"Pavlo"}, id="list"),
+        pytest.param("ml,ai", {"Pavlo"}, id="string"),
+        pytest.param(["ml", "nonexistent"], set(), id="no-match"),
+        pytest.param([], set(), id="empty"),
+        pytest.param(["ai"], {"Pavlo", "Anna"}, id="single"),
+    ])
+    def test_find_by_tags_all(self, readonly_sorting_service, tags, expected):
+        """Test finding contacts that have all specified tags."""
         # Pavlo has ['ml', 'ai'], Anna has ['ai']
-        results = sorting_service.find_by_tags_all(["ml", "ai"])
-        assert len(results) == 1
-        # Names include group prefix
-        assert "Pavlo" in results[0][0]
-    
-    def test_find_by_tags_all_with_string(self, sorting_service):
-        """Test finding contacts with all specified tags (string input)."""
-        results = sorting_service.find_by_tags_all("ml,ai")
-        assert len(results) == 1
-        # Names include group prefix
-        assert "Pavlo" in results[0][0]
-    
-    def test_find_by_tags_all_no_matches(self, sorting_service):
-        """Test finding contacts when no one has all tags."""
-        results = sorting_service.find_by_tags_all(["ml", "nonexistent"])
-        assert results == []
-    
-    def test_find_by_tags_all_empty_tags(self, sorting_service):
-        """Test finding contacts with empty tag list."""
-        results = sorting_service.find_by_tags_all([])
-        assert results == []
-    
-    def test_find_by_tags_all_single_tag(self, sorting_service):
-        """Test finding contacts with single tag."""
-        results = sorting_service.find_by_tags_all(["ai"])
-        assert len(results) == 2  # Both Pavlo and Anna have 'ai'
-        # Names include group prefix, check if contact name is in result
-        names_str = str([name for name, _ in results])
-        assert "Pavlo" in names_str
-        assert "Anna" in names_str
-    
-    def test_find_by_tags_any_with_list(self, sorting_service):
-        """Test finding contacts with any of specified tags (list input)."""
-        results = sorting_service.find_by_tags_any(["ml", "ai"])
-        assert len(results) == 2  # Both have at least one tag
-        # Names include group prefix, check if contact name is in result
-        names_str = str([name for name, _ in results])
-        assert "Pavlo" in names_str
-        assert "Anna" in names_str
-    
-    def test_find_by_tags_any_with_string(self, sorting_service):
-        """Test finding contacts with any of specified tags (string input)."""
-        results = sorting_service.find_by_tags_any("ml,ai")
-        assert len(results) == 2
-    
-    def test_find_by_tags_any_no_matches(self, sorting_service):
-        """Test finding contacts when no one has any of the tags."""
-        results = sorting_service.find_by_tags_any(["nonexistent", "alsononexistent"])
-        assert results == []
-    
-    def test_find_by_tags_any_empty_tags(self, sorting_service):
-        """Test finding contacts with empty tag list."""
-        results = sorting_service.find_by_tags_any([])
-        assert results == []
-    
-    def test_find_by_tags_any_single_tag(self, sorting_service):
-        """Test finding contacts with single tag."""
-        results = sorting_service.find_by_tags_any(["ml"])
-        assert len(results) == 1
-        # Names include group prefix
-        assert "Pavlo" in results[0][0]
-    
-    def test_prepare_tags_with_invalid_tag(self, contact_service):
+        results = readonly_sorting_service.find_by_tags_all(tags)
+        # Names include group prefix, so compare record names instead
+        assert {rec.name.value for _, rec in results} == expected
+    
+    @pytest.mark.parametrize("tags,expected", [
+        pytest.param(["ml", "ai"], {"Pavlo", "Anna"}, id="list"),
+        pytest.param("ml,ai", {"Pavlo", "Anna"}, id="string"),
+        pytest.param(["nonexistent", "alsononexistent"], set(), id="no-match"),
+        pytest.param([], set(), id="empty"),
+        pytest.param(["ml"], {"Pavlo"}, id="single"),
+    ])
+    def test_find_by_tags_any(self, readonly_sorting_service, tags, expected):
+        """Test finding contacts that have any of the specified tags."""
+        results = readonly_sorting_service.find_by_tags_any(tags)
+        assert {rec.name.value for _, rec in results} == expected
+    
+    @pytest.mark.parametrize("bad", INVALID_TAGS)
+    def test_prepare_tags_with_invalid_tag(self, contact_service, bad):
         """Test _prepare_tags with invalid tag."""
-        with pytest.raises(ValueError, match="Invalid tag"):
-            contact_service._prepare_tags(["valid", ""])
+        with pytest.raises(ValueError, match=INVALID_TAG_RE):
+            contact_service._prepare_tags(["valid", bad])
     
     def test_prepare_tags_with_string_input(self, contact_service):
         """Test _prepare_tags with comma-separated string."""
@@ -890,18 +780,18 @@ class TestIterNameRecord:
     
     def test_iter_name_record_normal(self, populated_service):
         """Test iterating over name-record pairs."""
-        items = list(populated_service._iter_name_record())
-        assert len(items) == 1
-        # Names include group prefix
-        assert "John" in items[0][0]
+        items = populated_service._iter_name_record()
+        # Names include group prefix, so compare record names instead
+        assert {rec.name.value for _, rec in items} == {"John"}
     
-    def test_iter_name_record_with_broken_addressbook(self, contact_service):
+    def test_iter_name_record_with_broken_addressbook(self):
         """Test _iter_name_record with broken address book structure."""
-        # Replace address_book.data with something that's not a dict
-        contact_service.address_book.data = "not_a_dict"
+        # Only address_book is read, so skip __init__ and fake a book whose data is not a dict
+        service = ContactService.__new__(ContactService)
+        service.address_book = SimpleNamespace(data="not_a_dict")
         
         with pytest.raises(RuntimeError, match="not recognized"):
-            list(contact_service._iter_name_record())
+            list(service._iter_name_record())
 
 
 class TestCalculateUpcomingBirthdays:
@@ -912,33 +802,21 @@ class TestCalculateUpcomingBirthdays:
         # Illia has no birthday, should be skipped
         results = sorting_service._calculate_upcoming_birthdays(days=365)
         # Should not crash, just skip Illia
-        names = [r["name"] for r in results]
-        assert "Illia" not in names
+        assert {r["name"] for r in results} == {"Pavlo", "Anna"}
     
-    def test_calculate_upcoming_birthdays_weekend_adjustment(self):
+    def test_calculate_upcoming_birthdays_weekend_adjustment(self, frozen_today):
         """Test that weekend birthdays are adjusted to Monday."""
-        book = AddressBook()
-        record = Record("Weekend")
-        
-        # Find a Saturday birthday in the near future
-        today = datetime.today().date()
-        days_ahead = (5 - today.weekday()) % 7  # Days until next Saturday
-        if days_ahead == 0:
-            days_ahead = 7  # If today is Saturday, use next Saturday
-        
-        saturday = today + timedelta(days=days_ahead)
+        saturday = frozen_today + timedelta(days=3)
         birthday_str = saturday.strftime("%d.%m") + ".1990"
-        record.add_birthday(birthday_str)
-        book.add_record(record)
+        book = build_book([("Weekend", None, birthday_str, None)])
         
         service = ContactService(book)
         results = service._calculate_upcoming_birthdays(days=14)
         
-        if results:  # Only test if birthday is in range
-            # Congratulation date should be Monday (2 days after Saturday)
-            congrat_date_str = results[0]["congratulation_date"]
-            congrat_date = datetime.strptime(congrat_date_str, "%d.%m.%Y").date()
-            assert congrat_date.weekday() == 0  # Monday
+        # Congratulation date should be Monday (2 days after Saturday)
+        assert results == [{"name": "Weekend", "congratulation_date": "18.03.2024"}]
+        congrat_date = datetime.strptime(results[0]["congratulation_date"], "%d.%m.%Y").date()
+        assert congrat_date.weekday() == 0  # Monday
 
 
 class TestEmailManagement:
@@ -970,7 +848,7 @@ class TestEmailManagement:
     
     def test_add_email_contact_not_found(self, contact_service):
         """Test adding email to non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             contact_service.add_email("NonExistent", "test@example.com")
     
     def test_add_email_invalid_format(self, contact_service):
@@ -990,7 +868,7 @@ class TestEmailManagement:
     
     def test_remove_email_contact_not_found(self, contact_service):
         """Test removing email from non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             contact_service.remove_email("NonExistent")
     
     def test_remove_email_not_set(self, contact_service):
@@ -1035,7 +913,7 @@ class TestAddressManagement:
     
     def test_set_address_contact_not_found(self, contact_service):
         """Test setting address for non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             contact_service.set_address("NonExistent", "UA", "Kyiv", "Main St 1")
     
     def test_remove_address(self, contact_service):
@@ -1049,7 +927,7 @@ class TestAddressManagement:
     
     def test_remove_address_contact_not_found(self, contact_service):
         """Test removing address from non-existent contact raises error."""
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(ValueError, match=NOT_FOUND_RE):
             contact_service.remove_address("NonExistent")
     
     def test_remove_address_not_set(self, contact_service):
@@ -27,15 +27,21 @@ class TestContainerConfiguration:
         book2 = container.address_book()
         assert book1 is book2
     
-    def test_contact_service_is_factory(self, container):
-        """Test that contact service is a factory."""
+    def test_contact_service_is_singleton(self, container):
+        """Test that contact service is resolved once and reused."""
         service1 = container.contact_service()
         service2 = container.contact_service()
-        # Factories create new instances, but they share the same address book
         assert isinstance(service1, ContactService)
-        assert isinstance(service2, ContactService)
-        # They should use the same address book instance
-        assert service1.address_book is service2.address_book
+        assert service1 is service2
+        # The service wraps the address book singleton
+        assert service1.address_book is container.address_book()
+    
+    def test_contact_service_override_still_applies(self, container):
+        """Test that overriding the singleton provider replaces the service."""
+        fake = object()
+        with container.contact_service.override(fake):
+            assert container.contact_service() is fake
+        assert isinstance(container.contact_service(), ContactService)
 
 
 class TestContainerProvides:
@@ -69,6 +69,12 @@ class TestNoteServiceBasics:
         contacts = service.list_contacts()
         assert len(contacts) == 1
         assert contacts[0] == ("Bob", "No phone")
+    
+    def test_service_has_no_instance_dict(self, note_service):
+        """Test NoteService keeps its state in __slots__."""
+        assert not hasattr(note_service, "__dict__")
+        with pytest.raises(AttributeError):
+            note_service.unexpected = True
 
 
 class TestNoteManagement:
@@ -31,3 +31,34 @@ def test_record_tags_validation():
         r.add_tag("bad tag")
     with pytest.raises(ValueError):
         r.add_tag("a" * 33)
+
+
+def test_record_tags_display_follows_changes():
+    r = Record("John Doe")
+    assert r.tags_display == ""
+
+    r.add_tag("ml")
+    r.add_tag("ai")
+    assert r.tags_display == "ml, ai"
+
+    r.remove_tag("ml")
+    assert r.tags_display == "ai"
+
+    r.set_tags("python, data")
+    assert r.tags_display == "python, data"
+
+    r.clear_tags()
+    assert r.tags_display == ""
+
+
+def test_record_tags_tuple_cached_until_change():
+    r = Record("John Doe")
+    r.set_tags("ai, ml")
+    first = r.tags_tuple
+    assert first == ("ai", "ml")
+    assert r.tags_tuple is first
+
+    r.add_tag("python")
+    assert r.tags_tuple == ("ai", "ml", "python")
+    assert r.has_tags_all(["ai", "python"]) is True
+    assert r.has_tags_any(["go", "ml"]) is True
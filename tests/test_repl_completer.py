@@ -9,7 +9,11 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from prompt_toolkit.document import Document
 from prompt_toolkit.completion import Completion as PromptCompletion
-from src.utils.repl_completer import ContextAwareCompleter, create_context_aware_completer
+from src.utils.repl_completer import (
+    ContextAwareCompleter,
+    create_context_aware_completer,
+    create_context_aware_completer_for_repl,
+)
 import click
 import typer
 
@@ -692,3 +696,153 @@ class TestContextAwareCompleterAdvanced:
 
 
 
+    
+    def test_navigation_is_cached_between_keystrokes(self, mock_original_completer):
+        """Test that resolved subcommands are reused on the next keystroke."""
+        final_cmd = click.Command("add")
+        arg = click.Argument(["title"])
+        arg._custom_shell_complete = lambda ctx, args, incomplete: ["note1", "note2"]
+        final_cmd.params = [arg]
+        
+        notes_group = click.MultiCommand()
+        notes_group.get_command = Mock(side_effect=lambda ctx, name: final_cmd if name == "add" else None)
+        notes_group.list_commands = Mock(return_value=["add", "list"])
+        
+        ctx = click.Context(notes_group)
+        completer = ContextAwareCompleter(mock_original_completer, ctx)
+        
+        first = [c.text for c in completer.get_completions(Document("add n"), None)]
+        second = [c.text for c in completer.get_completions(Document("add no"), None)]
+        
+        assert first == second == ["note1", "note2"]
+        notes_group.get_command.assert_called_once()
+    
+    def test_navigation_cache_reset_on_new_context(self, mock_original_completer):
+        """Test that replacing click_ctx drops cached navigation."""
+        ctx = click.Context(click.MultiCommand())
+        completer = ContextAwareCompleter(mock_original_completer, ctx)
+        completer._nav_cache[("add",)] = click.Command("add")
+        
+        completer.click_ctx = click.Context(click.MultiCommand())
+        
+        assert completer._nav_cache == {}
+    
+    def test_subcommand_prefix_matching_is_case_insensitive(self, mock_original_completer):
+        """Test that prefix matching uses the cached sorted name index."""
+        main_cmd = Mock(spec=click.MultiCommand)
+        main_cmd.__class__ = click.MultiCommand
+        main_cmd.list_commands = Mock(return_value=["notes", "Add", "all", "address", "birthdays"])
+        
+        ctx = Mock(spec=click.Context)
+        ctx.command = main_cmd
+        completer = ContextAwareCompleter(mock_original_completer, ctx)
+        
+        first = [c.text for c in completer.get_completions(Document("a"), None)]
+        second = [c.text for c in completer.get_completions(Document("AD"), None)]
+        
+        # list_commands() order, not alphabetical
+        assert first == ["Add", "all", "address"]
+        assert second == ["Add", "address"]
+        main_cmd.list_commands.assert_called_once()
+    
+    def test_subcommand_prefix_matches_keep_declared_order(self, mock_original_completer):
+        """Test that prefix matches follow creation order, as TyperGroup lists them."""
+        class OrderedGroup(click.Group):
+            def list_commands(self, ctx):
+                return list(self.commands)
+        
+        names = ("group-list", "group-add", "group-use", "group-remove", "group-rename", "add")
+        group = OrderedGroup(commands=[click.Command(name) for name in names])
+        completer = ContextAwareCompleter(mock_original_completer, click.Context(group))
+        
+        completions = [c.text for c in completer.get_completions(Document("group-"), None)]
+        
+        assert completions == ["group-list", "group-add", "group-use", "group-remove", "group-rename"]
+    
+    def test_autocompletion_attribute_used_when_custom_is_none(self, mock_original_completer):
+        """Test fallback to autocompletion when _custom_shell_complete is unset."""
+        cmd = click.Command("tag-add")
+        arg = click.Argument(["name"])
+        arg._custom_shell_complete = None
+        arg.autocompletion = lambda ctx, args, incomplete: ["Alice", "Bob"]
+        cmd.params = [arg]
+        group = click.Group(commands=[cmd])
+        
+        completer = ContextAwareCompleter(mock_original_completer, click.Context(group))
+        completions = [c.text for c in completer.get_completions(Document("tag-add A"), None)]
+        
+        assert completions == ["Alice"]
+        assert completer._ac_cache[arg] is arg.autocompletion
+    
+    def test_suggestions_reused_while_extending_word(self, mock_original_completer):
+        """Test that the callback runs once while the same word is extended."""
+        calls = []
+        
+        def names(ctx, args, incomplete):
+            calls.append(incomplete)
+            return ["Alice", "Alex", "Bob"]
+        
+        cmd = click.Command("phone")
+        arg = click.Argument(["name"])
+        arg._custom_shell_complete = names
+        cmd.params = [arg]
+        completer = ContextAwareCompleter(mock_original_completer, click.Context(click.Group(commands=[cmd])))
+        
+        def complete(text):
+            return [c.text for c in completer.get_completions(Document(text), None)]
+        
+        assert complete("phone a") == ["Alice", "Alex"]
+        assert complete("phone ali") == ["Alice"]
+        assert calls == ["a"]
+        
+        # new word or shorter prefix asks the callback again
+        assert complete("phone ") == ["Alice", "Alex", "Bob"]
+        assert complete("phone b") == ["Bob"]
+        assert complete("phone ") == ["Alice", "Alex", "Bob"]
+        assert calls == ["a", "", ""]
+    
+    def test_suggestions_refetched_for_line_not_extending_cached_one(self, mock_original_completer):
+        """Test that a same-prefix line that does not extend the cached line is re-fetched."""
+        data = ["Alice", "Bob"]
+        cmd = click.Command("delete")
+        arg = click.Argument(["name"])
+        arg._custom_shell_complete = lambda ctx, args, incomplete: list(data)
+        cmd.params = [arg]
+        completer = ContextAwareCompleter(mock_original_completer, click.Context(click.Group(commands=[cmd])))
+        
+        def complete(text):
+            return [c.text for c in completer.get_completions(Document(text), None)]
+        
+        assert complete("delete Al") == ["Alice"]
+        data[:] = ["Alina", "Bob"]
+        # "ali" extends the word "al", but the line is not a continuation
+        assert complete("delete ali") == ["Alina"]
+    
+    def test_repl_command_drops_cached_suggestions(self):
+        """Test that running a command makes the next prompt see fresh data."""
+        data = ["Alice", "Bob"]
+        
+        @click.group()
+        def cli():
+            pass
+        
+        @cli.command("delete")
+        @click.argument("name", shell_complete=lambda ctx, param, incomplete: list(data))
+        def delete(name):
+            data[:] = ["Alina", "Bob"]
+        
+        completer = create_context_aware_completer_for_repl(click.Context(cli))
+        
+        def complete(text):
+            return [c.text for c in completer.get_completions(Document(text), None)]
+        
+        assert complete("delete al") == ["Alice"]
+        cli.main(["delete", "Alice"], standalone_mode=False)
+        assert complete("delete ali") == ["Alina"]
+    
+    def test_repl_completer_without_ctx(self):
+        """Test that the REPL factory still works without a Click context."""
+        completer = create_context_aware_completer_for_repl(None)
+        
+        assert isinstance(completer, ContextAwareCompleter)
+        assert list(completer.get_completions(Document("a"), None)) == []
@@ -189,6 +189,11 @@ class TestContactSearch:
         assert len(results) == 1
         assert results[0][0] == "Alice Smith"
     
+    def test_search_contacts_by_tags_all_empty_query(self, search_service):
+        """Test TAGS_ALL with no tags matches nothing."""
+        results = search_service.search_contacts(" , ", ContactSearchType.TAGS_ALL)
+        assert results == []
+    
     def test_search_contacts_partial_match(self, search_service):
         """Test search works with partial matches."""
         results = search_service.search_contacts("doe", ContactSearchType.NAME)
@@ -33,6 +33,7 @@ def mock_record():
     record.birthday = None
     record.email = None
     record.tags_list.return_value = []
+    record.tags_display = ""
     record.list_notes.return_value = []
     return record
 
@@ -105,6 +106,14 @@ class TestSearchContactsImpl:
             "work,personal", ContactSearchType.TAGS_ANY
         )
     
+    @pytest.mark.parametrize("by", ["tags-all", "tags-any"])
+    def test_search_contacts_by_empty_tags_skips_service(self, mock_search_service, by):
+        """Test that blank tag input returns before searching."""
+        with container.search_service.override(mock_search_service):
+            _search_contacts_impl(" , ", by)
+        
+        mock_search_service.search_contacts.assert_not_called()
+    
     def test_search_contacts_by_notes_text(self, mock_search_service, mock_record):
         """Test searching contacts by note content."""
         mock_search_service.search_contacts.return_value = [("John", mock_record)]
@@ -266,6 +275,7 @@ class TestDisplayContactResultsTree:
     def test_display_results_with_tags(self, mock_record):
         """Test displaying results with tags."""
         mock_record.tags_list.return_value = ["work", "important"]
+        mock_record.tags_display = "work, important"
         
         display_contact_results_tree([("John", mock_record)], "query", "name")
         # Should not raise any errors
@@ -286,6 +296,22 @@ class TestDisplayContactResultsTree:
         display_contact_results_tree([("John", mock_record)], "query", "name")
         # Should not raise any errors
 
+    def test_display_large_results_uses_compact_panel(self, mock_record, monkeypatch):
+        """Test that large result sets skip the Tree and print one panel."""
+        import src.commands.search as search_module
+
+        printed = []
+        monkeypatch.setattr(search_module.console, "print", lambda obj: printed.append(obj))
+        mock_record.tags_list.return_value = ["work"]
+        mock_record.tags_display = "work"
+        results = [(f"User{i}", mock_record) for i in range(search_module._TREE_RESULTS_LIMIT + 1)]
+
+        display_contact_results_tree(results, "work", "tags-any")
+
+        assert len(printed) == 1
+        assert type(printed[0]).__name__ == "Panel"
+        assert "User0" in printed[0].renderable.plain
+
 
 class TestDisplayNoteResultsTree:
     """Tests for display_note_results_tree function."""
@@ -16,6 +16,16 @@ def test_normalize_and_validate_one():
     assert is_valid_tag("a" * 33) is False  # >32
 
 
+def test_is_valid_tag_charset_and_bounds():
+    assert is_valid_tag("a" * 32) is True
+    assert is_valid_tag("data,science") is True  # quoted csv chunk
+    assert is_valid_tag("ok_tag-1") is True
+    assert is_valid_tag("") is False
+    assert is_valid_tag("ML") is False  # not normalized
+    assert is_valid_tag("tag@#$") is False
+    assert is_valid_tag("тег") is False  # non-ascii
+
+
 def test_tags_init_and_replace():
     t = Tags(["AI", " ml ", "ai"])
     assert t.as_list() == ["ai", "ml"]  # lower + dedup
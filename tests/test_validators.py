@@ -40,6 +40,11 @@ class TestPhoneValidator:
         second = validate_phone("+380 67 235 5960")
         assert first == second == "+380672355960"
 
+    def test_validate_phone_repeated_invalid_still_raises(self):
+        for _ in range(2):
+            with pytest.raises(typer.BadParameter, match="not possible"):
+                validate_phone("123")
+
 class TestBirthdayValidator:
     def test_validate_birthday_valid(self):
         assert validate_birthday("15.05.1990") == "15.05.1990"
@@ -56,6 +61,18 @@ class TestBirthdayValidator:
                 validate_birthday(bad)
             assert "dd.mm.yyyy" in str(exc.value).lower()
 
+    def test_validate_birthday_nonexistent_date(self):
+        for bad in ["31.02.2000", "29.02.2001", "00.01.2000"]:
+            with pytest.raises(typer.BadParameter, match="DD.MM.YYYY"):
+                validate_birthday(bad)
+
+    def test_validate_birthday_rejects_non_ascii_digits(self):
+        with pytest.raises(typer.BadParameter, match="DD.MM.YYYY"):
+            validate_birthday("١٥.٠٥.١٩٩٠")
+
+    def test_validate_birthday_single_digit_parts_normalized(self):
+        assert validate_birthday(" 1.5.1990 ") == "01.05.1990"
+
     def test_validate_birthday_future(self):
         with pytest.raises(typer.BadParameter) as exc:
             validate_birthday("01.01.3000")
@@ -100,3 +117,14 @@ class TestTagSplitting:
 
     def test_split_tags_string_quotes_and_spaces(self):
         assert split_tags_string('  "a,b" ,  c  ') == ["a,b", "c"]
+
+    def test_split_tags_string_returns_fresh_list(self):
+        first = split_tags_string("ml, ai")
+        first.append("mutated")
+        assert split_tags_string("ml, ai") == ["ml", "ai"]
+
+    def test_split_tags_string_single_tag(self):
+        assert split_tags_string("  ml  ") == ["ml"]
+
+    def test_split_tags_string_skips_empty_chunks(self):
+        assert split_tags_string(",,ml,, ai,") == ["ml", "ai"]